@@ -64,10 +64,11 @@ def percentile_bootstrap(func: Callable) -> Callable:
     >>> t90 = percentile_doy(tas_ref, window=5, per=90)
     >>> tg90p(tas=tas, tas_per=t90.sel(percentiles=90), freq="YS", bootstrap=True)
     """
+    sig = signature(func)
 
     @wraps(func)
     def wrapper(*args, **kwargs):  # numpydoc ignore=GL08
-        ba = signature(func).bind(*args, **kwargs)
+        ba = sig.bind(*args, **kwargs)
         ba.apply_defaults()
         bootstrap = ba.arguments.get("bootstrap", False)
         if bootstrap is False:
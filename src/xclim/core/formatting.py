@@ -98,10 +98,7 @@ class AttrFormatter(string.Formatter):
         str
             The formatted string.
         """
-        for k, v in DEFAULT_FORMAT_PARAMS.items():
-            if k not in kwargs:
-                kwargs.update({k: v})
-        return super().format(format_string, *args, **kwargs)
+        return self.vformat(format_string, args, DEFAULT_FORMAT_PARAMS | kwargs)
 
     def format_field(self, value, format_spec: str) -> str:
         """
@@ -459,6 +456,7 @@ def update_xclim_history(func: Callable) -> Callable:
     Callable
         The decorated function.
     """
+    sig = signature(func)
 
     @wraps(func)
     def _call_and_add_history(*args, **kwargs):
@@ -478,7 +476,7 @@ def update_xclim_history(func: Callable) -> Callable:
 
         # The wrapper hides how the user passed the arguments (positional or keyword)
         # Instead of having it all position, we have it all keyword-like for explicitness.
-        bound_args = signature(func).bind(*args, **kwargs)
+        bound_args = sig.bind(*args, **kwargs)
         attr = update_history(
             gen_call_string(func.__name__, **bound_args.arguments),
             *da_list,
@@ -12,6 +12,7 @@ import logging
 import warnings
 from collections.abc import Callable
 from copy import deepcopy
+from functools import lru_cache
 from importlib.resources import files
 from inspect import signature
 from typing import Any, Literal, cast
@@ -136,6 +137,12 @@ def _register_conversion(conversion, direction):
     return _func_register
 
 
+@lru_cache(maxsize=1024)
+def _parse_units(unit: str) -> pint.Unit:
+    """Parse a unit string, caching the result as parsing compound units with pint is slow."""
+    return units.parse_units(unit)
+
+
 def units2pint(
     value: xr.DataArray | units.Unit | units.Quantity | dict | str,
 ) -> pint.Unit:
@@ -195,7 +202,7 @@ def units2pint(
     if unit.strip() in possibilities:
         raise ValidationError("Remove white space from temperature units, e.g. use `degC`.")
 
-    pu = units.parse_units(unit)
+    pu = _parse_units(unit)
     if metadata == "temperature: difference":
         return (1 * pu - 1 * pu).units
     return pu
@@ -1237,17 +1244,14 @@ def check_units(val: str | xr.DataArray | None, dim: str | xr.DataArray | None =
         standard_name = None
     context = infer_context(standard_name=standard_name, dimension=_dim)
 
-    # Issue originally introduced in https://github.com/hgrecco/pint/issues/1486
-    # Should be resolved in pint v0.24. See: https://github.com/hgrecco/pint/issues/1913
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", category=DeprecationWarning)
-        if str(val).startswith("UNSET "):
-            warnings.warn(
-                "This index calculation will soon require user-specified thresholds.",
-                FutureWarning,
-                stacklevel=4,
-            )
-            val = str(val).replace("UNSET ", "")
+    # Only test strings, the repr of a DataArray is expensive
+    if isinstance(val, str) and val.startswith("UNSET "):
+        warnings.warn(
+            "This index calculation will soon require user-specified thresholds.",
+            FutureWarning,
+            stacklevel=4,
+        )
+        val = val.replace("UNSET ", "")
 
     if isinstance(val, int | float):
         raise TypeError("Please set units explicitly using a string.")
@@ -132,7 +132,7 @@ as _all_ seasons are used, even the very short shoulder seasons.
 # Methods starting with a "_" are not usable with xarray objects, whereas the others are.
 from __future__ import annotations
 
-from collections import OrderedDict, namedtuple
+from collections import namedtuple
 from collections.abc import Sequence
 
 import numpy as np
@@ -141,7 +141,7 @@ from numba import njit, vectorize
 
 from xclim.core._types import Quantified
 from xclim.core.units import convert_units_to, declare_units
-from xclim.core.utils import get_temp_dimname
+from xclim.core.utils import get_temp_dimname, uses_dask
 from xclim.indices import run_length as rl
 
 __all__ = [
@@ -184,6 +184,12 @@ Parameters with units are given as a tuple of default value and units.
 A more complete explanation of these parameters is given in the doc of :py:func:`fire_weather_ufunc`.
 """
 
+# Units of the parameters that need to be converted.
+_params_units: dict[str, str] = {k: v[1] for k, v in default_params.items() if isinstance(v, tuple)}
+
+# Order of the codes and indexes in the outputs of fire_weather_ufunc.
+_indexes_order: dict[str, int] = {name: i for i, name in enumerate(["DC", "DMC", "FFMC", "ISI", "BUI", "FWI", "DSR"])}
+
 # SECTION 1 - Codes - Numba accelerated and vectorized functions
 
 # Values taken from GFWED code
@@ -206,7 +212,7 @@ DAY_LENGTH_FACTORS = np.array(
 )
 
 
-@njit
+@njit(cache=True)
 def _day_length(lat: int | float, mth: int):  # pragma: no cover
     """Return the average day length for a month within latitudinal bounds."""
     if -30 > lat >= -90:
@@ -226,7 +232,7 @@ def _day_length(lat: int | float, mth: int):  # pragma: no cover
     return dl[mth - 1]
 
 
-@njit
+@njit(cache=True)
 def _day_length_factor(lat: float, mth: int):  # pragma: no cover
     """Return the day length factor."""
     if -15 > lat >= -90:
@@ -242,7 +248,40 @@ def _day_length_factor(lat: float, mth: int):  # pragma: no cover
     return dlf[mth - 1]
 
 
-@vectorize(nopython=True)
+def _build_daylength_tables(lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Tabulate the day lengths and day length factors of each month for the given latitudes.
+
+    Parameters
+    ----------
+    lat : array_like
+        Latitudes, 1D.
+
+    Returns
+    -------
+    day_lengths : np.ndarray
+        Same as :py:func:`_day_length`, shape (lat, 12).
+    day_length_factors : np.ndarray
+        Same as :py:func:`_day_length_factor`, shape (lat, 12).
+    """
+    lat = np.asarray(lat, dtype=float)
+    if not np.all((lat >= -90) & (lat <= 90)):
+        raise ValueError("Invalid lat specified.")
+    lat = lat[:, np.newaxis]
+    day_lengths = np.select(
+        [lat < -30, lat < -15, lat < 15, lat < 30],
+        [DAY_LENGTHS[0], DAY_LENGTHS[1], DAY_LENGTHS[2], DAY_LENGTHS[3]],
+        DAY_LENGTHS[4],
+    )
+    day_length_factors = np.select(
+        [lat < -15, lat < 15],
+        [DAY_LENGTH_FACTORS[0], DAY_LENGTH_FACTORS[1]],
+        DAY_LENGTH_FACTORS[2],
+    )
+    return day_lengths, day_length_factors
+
+
+@vectorize(nopython=True, cache=True)
 def _fine_fuel_moisture_code(t, p, w, h, ffmc0):  # pragma: no cover
     """
     Compute the fine fuel moisture code over one time step.
@@ -295,10 +334,8 @@ def _fine_fuel_moisture_code(t, p, w, h, ffmc0):  # pragma: no cover
             )
             kw = kl * (0.581 * np.exp(0.0365 * t))  # *Eq.7b*#
             m = ew - (ew - mo) / 10.0**kw  # *Eq.9*#
-        elif mo > ew:
-            m = mo
         else:
-            raise ValueError()
+            m = mo
     elif mo == ed:
         m = mo
     else:
@@ -315,7 +352,7 @@ def _fine_fuel_moisture_code(t, p, w, h, ffmc0):  # pragma: no cover
     return ffmc
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _duff_moisture_code(
     t: np.ndarray,
     p: np.ndarray,
@@ -349,8 +386,14 @@ def _duff_moisture_code(
     """
     if np.isnan(dmc0):
         return np.nan
+    return _duff_moisture_code_kernel(t, p, h, _day_length(lat, mth), dmc0)
 
-    dl = _day_length(lat, mth)
+
+@njit(cache=True)
+def _duff_moisture_code_kernel(t: float, p: float, h: float, dl: float, dmc0: float) -> float:  # pragma: no cover
+    """Compute the Duff moisture code over one time step, given the day length `dl`."""
+    if np.isnan(dmc0):
+        return np.nan
 
     if t < -1.1:
         rk = 0
@@ -381,7 +424,7 @@ def _duff_moisture_code(
     return dmc
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _drought_code(  # pragma: no cover
     t: np.ndarray,
     p: np.ndarray,
@@ -410,8 +453,12 @@ def _drought_code(  # pragma: no cover
     array_like
         Drought code at the current timestep
     """
-    fl = _day_length_factor(lat, mth)  # type: ignore
+    return _drought_code_kernel(t, p, _day_length_factor(lat, mth), dc0)
+
 
+@njit(cache=True)
+def _drought_code_kernel(t: float, p: float, fl: float, dc0: float) -> float:  # pragma: no cover
+    """Compute the drought code over one time step, given the day length factor `fl`."""
     t = max(t, -2.8)  # type: ignore
     pe = (0.36 * (t + 2.8) + fl) / 2  # *Eq.22*#
     pe = max(pe, 0.0)  # type: ignore
@@ -429,7 +476,7 @@ def _drought_code(  # pragma: no cover
             dc = pe
     else:  # f p <= 2.8:
         dc = dc0 + pe
-    return dc  # type: ignore
+    return dc
 
 
 def initial_spread_index(ws: np.ndarray, ffmc: np.ndarray) -> np.ndarray:
@@ -448,10 +495,15 @@ def initial_spread_index(ws: np.ndarray, ffmc: np.ndarray) -> np.ndarray:
     array_like
         Initial spread index.
     """
+    return _initial_spread_index_kernel(ws, ffmc)
+
+
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], nopython=True, cache=True)
+def _initial_spread_index_kernel(ws: float, ffmc: float) -> float:  # pragma: no cover
+    """Compute the initial spread index, see :py:func:`initial_spread_index`."""
     mo = 147.2 * (101.0 - ffmc) / (59.5 + ffmc)  # *Eq.1*#
     ff = 19.1152 * np.exp(mo * -0.1386) * (1.0 + (mo**5.31) / 49300000.0)  # *Eq.25*#
-    isi: np.ndarray = ff * np.exp(0.05039 * ws)  # *Eq.26*#
-    return isi
+    return ff * np.exp(0.05039 * ws)  # *Eq.26*#
 
 
 def build_up_index(dmc, dc):
@@ -470,18 +522,24 @@ def build_up_index(dmc, dc):
     array
         Build up index.
     """
+    # Comparisons with NaNs are expected and harmless here.
+    with np.errstate(invalid="ignore"):
+        return _build_up_index_kernel(dmc, dc)
+
+
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], nopython=True, cache=True)
+def _build_up_index_kernel(dmc: float, dc: float) -> float:  # pragma: no cover
+    """Compute the build-up index, see :py:func:`build_up_index`."""
     # Ensure we don't have a division by 0
-    denom = np.where((dmc == 0) & (dc == 0), np.nan, dmc + 0.4 * dc)
-    bui = np.where(
-        (dmc == 0) & (dc == 0),
-        0,
-        np.where(
-            dmc <= 0.4 * dc,
-            (0.8 * dc * dmc) / denom,  # *Eq.27a*#
-            dmc - (1.0 - 0.8 * dc / denom) * (0.92 + (0.0114 * dmc) ** 1.7),
-        ),  # *Eq.27b*#
-    )
-    return np.clip(bui, 0, None)
+    if dmc == 0 and dc == 0:
+        return 0.0
+    if dmc <= 0.4 * dc:
+        bui = (0.8 * dc * dmc) / (dmc + 0.4 * dc)  # *Eq.27a*#
+    else:
+        bui = dmc - (1.0 - 0.8 * dc / (dmc + 0.4 * dc)) * (0.92 + (0.0114 * dmc) ** 1.7)  # *Eq.27b*#
+    if bui < 0:
+        return 0.0
+    return bui
 
 
 # TODO: Does this need to be renamed?
@@ -501,12 +559,20 @@ def fire_weather_index(isi: np.ndarray, bui: np.ndarray) -> np.ndarray:
     array-like
         The Fire Weather Index.
     """
-    fwi = np.where(
-        bui <= 80.0,
-        0.1 * isi * (0.626 * bui**0.809 + 2.0),  # *Eq.28a*#
-        0.1 * isi * (1000.0 / (25.0 + 108.64 / np.exp(0.023 * bui))),
-    )  # *Eq.28b*#
-    fwi[fwi > 1] = np.exp(2.72 * (0.434 * np.log(fwi[fwi > 1])) ** 0.647)  # *Eq.30b*#
+    # Comparisons with NaNs are expected and harmless here.
+    with np.errstate(invalid="ignore"):
+        return _fire_weather_index_kernel(isi, bui)
+
+
+@vectorize(["float32(float32, float32)", "float64(float64, float64)"], nopython=True, cache=True)
+def _fire_weather_index_kernel(isi: float, bui: float) -> float:  # pragma: no cover
+    """Compute the fire weather index, see :py:func:`fire_weather_index`."""
+    if bui <= 80.0:
+        fwi = 0.1 * isi * (0.626 * bui**0.809 + 2.0)  # *Eq.28a*#
+    else:
+        fwi = 0.1 * isi * (1000.0 / (25.0 + 108.64 / np.exp(0.023 * bui)))  # *Eq.28b*#
+    if fwi > 1:
+        fwi = np.exp(2.72 * (0.434 * np.log(fwi)) ** 0.647)  # *Eq.30b*#
     return fwi
 
 
@@ -524,10 +590,16 @@ def daily_severity_rating(fwi: np.ndarray) -> np.ndarray:
     array-like
         The Daily Severity Rating.
     """
+    return _daily_severity_rating_kernel(fwi)
+
+
+@vectorize(["float32(float32)", "float64(float64)"], nopython=True, cache=True)
+def _daily_severity_rating_kernel(fwi: float) -> float:  # pragma: no cover
+    """Compute the daily severity rating, see :py:func:`daily_severity_rating`."""
     return 0.0272 * fwi**1.77
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _overwintering_drought_code(
     DCf: np.ndarray, wpr: np.ndarray, a: float, b: float, minDC: int
 ) -> np.ndarray | np.nan:  # pragma: no cover
@@ -554,6 +626,14 @@ def _overwintering_drought_code(
     array-like or np.nan
         The Overwintered Drought Code.
     """
+    return _overwintering_drought_code_kernel(DCf, wpr, a, b, minDC)
+
+
+@njit(cache=True)
+def _overwintering_drought_code_kernel(
+    DCf: float, wpr: float, a: float, b: float, minDC: float
+) -> float:  # pragma: no cover
+    """Compute the season-starting drought code of a single point, see :py:func:`_overwintering_drought_code`."""
     if np.isnan(DCf) or np.isnan(wpr):
         return np.nan
     Qf = 800 * np.exp(-DCf / 400)
@@ -565,6 +645,117 @@ def _overwintering_drought_code(
 
 # SECTION 2 : Iterators
 
+# Fire season methods, each computed by its own compiled kernel.
+_fire_season_methods: tuple[str, ...] = ("WF93", "LA08", "GFWED")
+
+
+@njit(cache=True, nogil=True)
+def _fire_season_wf93(
+    tas, start_index, temp_start_thresh, temp_end_thresh, temp_condition_days, season_mask
+):  # pragma: no cover
+    """
+    Fill the fire season mask of 2D arrays (points, time) with the WF93 method.
+
+    The "all of the last N days" conditions are tracked with counters of consecutive days, so that each day
+    costs O(1) instead of a look back over the whole window.
+    """
+    npts, ntime = tas.shape
+    for ip in range(npts):
+        # Number of consecutive days (up to the last one looked at) above the start threshold
+        # and below the end threshold.
+        n_warm = 0
+        n_cold = 0
+        active = False
+        for it in range(ntime):
+            # In WF93, the check is done the N last days, EXCLUDING the current one.
+            if it >= start_index:
+                # Start up when the last X days were all above a threshold.
+                start_up = n_warm >= temp_condition_days
+                # Shut down when the last X days were all below a threshold
+                shut_down = n_cold >= temp_condition_days
+                active = (active or start_up) and not shut_down
+            n_warm = n_warm + 1 if tas[ip, it] > temp_start_thresh else 0
+            n_cold = n_cold + 1 if tas[ip, it] < temp_end_thresh else 0
+
+            # Mask is on if the previous days was on OR is there is a start-up,  AND if it's not a shut-down,
+            # Aka is off if either the previous day was or it is a shut-down.
+            season_mask[ip, it] = active
+
+
+@njit(cache=True, nogil=True)
+def _fire_season_la08(  # pylint: disable=R0913
+    tas,
+    snd,
+    start_index,
+    temp_end_thresh,
+    temp_condition_days,
+    snow_condition_days,
+    snow_thresh,
+    season_mask,
+):  # pragma: no cover
+    """Fill the fire season mask of 2D arrays (points, time) with the LA08 method."""
+    npts, ntime = tas.shape
+    for ip in range(npts):
+        # Number of consecutive days (up to the current one) below the end threshold and without snow on the ground.
+        n_cold = 0
+        n_nosnow = 0
+        active = False
+        for it in range(ntime):
+            # In LA08, the check INCLUDES the current day.
+            n_cold = n_cold + 1 if tas[ip, it] < temp_end_thresh else 0
+            n_nosnow = n_nosnow + 1 if snd[ip, it] <= snow_thresh else 0
+            if it >= start_index:
+                # Start up when the last X days including today have no snow on the ground.
+                start_up = n_nosnow >= snow_condition_days
+                # Shut down when today has snow OR the last X days (including today) were all below a threshold.
+                shut_down = snd[ip, it] > snow_thresh or n_cold >= temp_condition_days
+                active = (active or start_up) and not shut_down
+            season_mask[ip, it] = active
+
+
+@njit(cache=True, nogil=True)
+def _fire_season_gfwed(  # pylint: disable=R0913
+    tas,
+    snd,
+    start_index,
+    temp_start_thresh,
+    temp_end_thresh,
+    temp_condition_days,
+    snow_condition_days,
+    snow_thresh,
+    season_mask,
+):  # pragma: no cover
+    """Fill the fire season mask of 2D arrays (points, time) with the GFWED method."""
+    npts, ntime = tas.shape
+    for ip in range(npts):
+        active = False
+        # The mask stays off before the first complete window.
+        for it in range(start_index, ntime):
+            # Means are summed over the window rather than with running sums, which would accumulate
+            # rounding errors over the whole period and keep NaNs forever.
+            msnow = 0.0
+            for iw in range(it - snow_condition_days + 1, it + 1):
+                msnow += snd[ip, iw]
+            msnow = msnow / snow_condition_days
+            mtemp = 0.0
+            for iw in range(it - temp_condition_days + 1, it + 1):
+                mtemp += tas[ip, iw]
+            mtemp = mtemp / temp_condition_days
+
+            # Start up when the last X days including today have no snow on the ground.
+            start_up = mtemp > temp_start_thresh and msnow < snow_thresh
+            # Shut down when mean snow OR mean temp are over/under threshold
+            shut_down = msnow >= snow_thresh or mtemp < temp_end_thresh
+            active = (active or start_up) and not shut_down
+            season_mask[ip, it] = active
+
+
+def _time_contiguous(arr: np.ndarray) -> np.ndarray:
+    """Return the array, or a C-ordered copy if successive time steps (the last axis) are not contiguous in memory."""
+    if arr.shape[-1] > 1 and arr.strides[-1] != arr.itemsize:
+        return np.ascontiguousarray(arr)
+    return arr
+
 
 # FIXME: default_params should be supplied within the logic of the function.
 def _fire_season(
@@ -604,71 +795,289 @@ def _fire_season(
     ndarray [bool]
         `True` where the fire season is active, same shape as tas.
     """
-    season_mask = np.full_like(tas, False, dtype=bool)
-
     if method == "WF93":
-        # In WF93, the check is done the N last days, EXCLUDING the current one.
         start_index = temp_condition_days + 1
     elif method in ["LA08", "GFWED"]:
-        # In LA08, the check INCLUDES the current day,
         start_index = max(temp_condition_days, snow_condition_days)
+        if snd is None or np.ndim(snd) == 0:
+            raise TypeError(f"`snd` must be given with method '{method}'.")
     else:
         raise ValueError("`method` must be one of 'WF93', 'LA08' or 'GFWED'.")
 
-    for it in range(start_index, tas.shape[-1]):
-        if method == "WF93":
-            temp = tas[..., it - temp_condition_days : it]
-
-            # Start up when the last X days were all above a threshold.
-            start_up = np.all(temp > temp_start_thresh, axis=-1)
-            # Shut down when the last X days were all below a threshold
-            shut_down = np.all(temp < temp_end_thresh, axis=-1)
-
-        elif method == "LA08":
-            snow = snd[..., it - snow_condition_days + 1 : it + 1]
-            temp = tas[..., it - temp_condition_days + 1 : it + 1]
-
-            # Start up when the last X days including today have no snow on the ground.
-            start_up = np.all(snow <= snow_thresh, axis=-1)
-            # Shut down when today has snow OR the last X days (including today) were all below a threshold.
-            shut_down = (snd[..., it] > snow_thresh) | np.all(temp < temp_end_thresh, axis=-1)
-
-        elif method == "GFWED":
-            msnow = np.mean(snd[..., it - snow_condition_days + 1 : it + 1], axis=-1)
-            mtemp = np.mean(tas[..., it - temp_condition_days + 1 : it + 1], axis=-1)
-
-            # Start up when the last X days including today have no snow on the ground.
-            start_up = (mtemp > temp_start_thresh) & (msnow < snow_thresh)
-
-            # Shut down when mean snow OR mean temp are over/under threshold
-            shut_down = (msnow >= snow_thresh) | (mtemp < temp_end_thresh)
-        else:
-            raise ValueError("`method` must be one of 'WF93', 'LA08' or 'GFWED'.")
-
-        # Mask is on if the previous days was on OR is there is a start-up,  AND if it's not a shut-down,
-        # Aka is off if either the previous day was or it is a shut-down.
-        season_mask[..., it] = (season_mask[..., it - 1] | start_up) & ~shut_down
-
-    return season_mask
+    ntime = tas.shape[-1]
+    tas2d = _time_contiguous(np.asarray(tas).reshape(-1, ntime))
+    season_mask = np.zeros(tas2d.shape, dtype=bool)
+    if method == "WF93":
+        _fire_season_wf93(
+            tas2d,
+            start_index,
+            float(temp_start_thresh),
+            float(temp_end_thresh),
+            int(temp_condition_days),
+            season_mask,
+        )
+    elif method == "LA08":
+        _fire_season_la08(
+            tas2d,
+            _time_contiguous(np.broadcast_to(snd, tas.shape).reshape(-1, ntime)),
+            start_index,
+            float(temp_end_thresh),
+            int(temp_condition_days),
+            int(snow_condition_days),
+            float(snow_thresh),
+            season_mask,
+        )
+    else:
+        _fire_season_gfwed(
+            tas2d,
+            _time_contiguous(np.broadcast_to(snd, tas.shape).reshape(-1, ntime)),
+            start_index,
+            float(temp_start_thresh),
+            float(temp_end_thresh),
+            int(temp_condition_days),
+            int(snow_condition_days),
+            float(snow_thresh),
+            season_mask,
+        )
+    return season_mask.reshape(tas.shape)
+
+
+@njit(cache=True, nogil=True)
+def _fwi_core(  # noqa: C901  # pylint: disable=R0912, R0913, R0914, R0915
+    tas,
+    pr,
+    rh,
+    ws,
+    snd,
+    mth,
+    day_lengths,
+    day_length_factors,
+    season_mask,
+    dc0,
+    dmc0,
+    ffmc0,
+    winter_pr,
+    out_dc,
+    out_dmc,
+    out_ffmc,
+    out_isi,
+    out_bui,
+    out_fwi,
+    out_dsr,
+    out_winter_pr,
+    seasonal,
+    initial_start_up,
+    overwintering,
+    dry_start,
+    dry_start_gfwed,
+    dry_start_snow,
+    dc_start,
+    dmc_start,
+    ffmc_start,
+    carry_over_fraction,
+    wetting_efficiency_fraction,
+    prec_thresh,
+    dc_dry_factor,
+    dmc_dry_factor,
+    snow_thresh,
+    snow_cover_days,
+    snow_min_cover_frac,
+    snow_min_mean_depth,
+):  # pragma: no cover
+    """
+    Iterate the fire weather codes over time, one grid point at a time.
 
+    All time-dependent arrays have shape (points, time), the others have shape (points,), except the day lengths
+    and day length factors tables which have shape (points, 12).
+    Outputs that were not requested are given as empty arrays and are never written to.
+    The codes of the previous day, the overwintering and dry start states are carried as scalars.
+    """
+    do_dc = out_dc.size > 0
+    do_dmc = out_dmc.size > 0
+    do_ffmc = out_ffmc.size > 0
+    do_isi = out_isi.size > 0
+    do_bui = out_bui.size > 0
+    do_fwi = out_fwi.size > 0
+    do_dsr = out_dsr.size > 0
+
+    npts, ntime = tas.shape
+    for ip in range(npts):
+        dc = dc0[ip]
+        dmc = dmc0[ip]
+        ffmc = ffmc0[ip]
+        ow_dc = dc0[ip]
+        ow_dmc = dmc0[ip]
+        wpr = winter_pr[ip]
+
+        if not seasonal:
+            # "Always on" mode, start with the default values.
+            if np.isnan(dc):
+                dc = dc_start
+            if np.isnan(dmc):
+                dmc = dmc_start
+            if np.isnan(ffmc):
+                ffmc = ffmc_start
+        elif overwintering:
+            # In overwintering, dc0 is understood as the previous season's last DC code.
+            dc = np.nan
 
-def _fire_weather_calc(  # noqa: C901  # pylint: disable=R0912, R0915
-    tas, pr, rh, ws, snd, mth, lat, season_mask, dc0, dmc0, ffmc0, winter_pr, **params
-):
+        active = False
+        start_up = False
+        shut_down = False
+        winter = False
+        start_up_wet = False
+        wetpts = False
+        isi = np.nan
+        bui = np.nan
+        fwi = np.nan
+        for it in range(ntime):
+            if seasonal:
+                # Not in the always on mode, thus we must care about start-up and shut-downs of the fire season.
+                # The mask of the previous day is carried from the last iteration, it is read only once.
+                was_active = active
+                active = season_mask[ip, it] != 0
+                if it == 0:
+                    # As if the previous iteration was all 0s, or continue the previous state.
+                    # The latter is meant for special corner cases when we use the season mask
+                    # but some points are already "on" on the first day AND we know previous DC DMC and FFMC.
+                    was_active = False if initial_start_up else active
+
+                # Encode the masks of the previous and current days into a single state:
+                # 0 is winter, 1 a shut-down, 2 a start-up and 3 the active season, where the codes simply carry on.
+                state = 2 * active + was_active
+                if state != 3:
+                    # In [ME19], there are the 4 cases (in order), no need for the last one, it is implicit.
+                    shut_down = state == 1
+                    winter = state == 0
+                    start_up = state == 2
+
+                    if dry_start:
+                        # When we use special start values for dry cells,
+                        # cells where the current precipitation is significant
+                        wetpts = pr[ip, it] > prec_thresh
+
+                        if dry_start_snow:
+                            # This is for the GFWED mode with snow.
+                            # The snow cover history only matters on start-up days, it is not tracked on the others.
+                            start_up_wet = False
+                            if start_up and it >= snow_cover_days:
+                                snow_days = 0
+                                snow_sum = 0.0
+                                for iw in range(it - snow_cover_days + 1, it + 1):
+                                    if snd[ip, iw] > snow_thresh:
+                                        snow_days += 1
+                                    snow_sum += snd[ip, iw]
+
+                                # Points where the snow cover is enough to trigger a "wet" start-up.
+                                start_up_wet = (snow_days / snow_cover_days >= snow_min_cover_frac) and (
+                                    snow_sum / snow_cover_days >= snow_min_mean_depth
+                                )
+
+                    if do_dc:
+                        if overwintering:
+                            if shut_down:
+                                # Store end of season DC and put current precip on the fist day of winter.
+                                ow_dc = dc
+                                wpr = pr[ip, it]
+                            elif winter:
+                                # Winter, add current precip.
+                                wpr = wpr + pr[ip, it]
+                            elif start_up:
+                                # Where ow_dc is NaN (happens at the start of the first season when no ow_DC was given
+                                # in input), put the default start.
+                                if np.isnan(ow_dc):
+                                    dc = dc_start
+                                else:
+                                    dc = _overwintering_drought_code_kernel(
+                                        ow_dc, wpr, carry_over_fraction, wetting_efficiency_fraction, dc_start
+                                    )
+                                # Put NaN to be explicit.
+                                ow_dc = np.nan
+                                wpr = np.nan
+                        elif dry_start:
+                            # Dry start-up for DC is overridden by overwintering.
+                            if shut_down:
+                                ow_dc = dc_start
+                            if dry_start_gfwed:
+                                # The GFWED includes the current day in the "wet points" check.
+                                if start_up or winter:
+                                    ow_dc = 0.0 if wetpts else ow_dc + dc_dry_factor
+                            elif winter:  # "CFS"
+                                ow_dc = dc_start if wetpts else ow_dc + dc_dry_factor
+                            if start_up_wet:
+                                # Points where we have start-up and where snow cover was enough
+                                # We cancel dry dc accumulation and switch to conventional
+                                ow_dc = dc_start
+                            if start_up:
+                                dc = ow_dc
+                                ow_dc = np.nan
+                        elif start_up:
+                            dc = dc_start
+                        if shut_down:
+                            dc = np.nan
+
+                    if do_dmc:
+                        if dry_start:
+                            if shut_down:
+                                ow_dmc = dmc_start
+                            if dry_start_gfwed:
+                                # The GFWED includes the current day in the "wet points" check.
+                                if start_up or winter:
+                                    ow_dmc = 0.0 if wetpts else ow_dmc + dmc_dry_factor
+                            elif winter:  # "CFS"
+                                ow_dmc = dmc_start if wetpts else ow_dmc + dmc_dry_factor
+                            if start_up_wet:
+                                ow_dmc = dmc_start
+                            if start_up:
+                                dmc = ow_dmc
+                                ow_dmc = np.nan
+                        elif start_up:
+                            dmc = dmc_start
+                        if shut_down:
+                            dmc = np.nan
+
+                    if do_ffmc:
+                        if start_up:
+                            ffmc = ffmc_start
+                        if shut_down:
+                            ffmc = np.nan
+
+            # Main computation
+            if do_dc:
+                dc = _drought_code_kernel(tas[ip, it], pr[ip, it], day_length_factors[ip, mth[ip, it] - 1], dc)
+                out_dc[ip, it] = dc
+            if do_dmc:
+                dmc = _duff_moisture_code_kernel(
+                    tas[ip, it], pr[ip, it], rh[ip, it], day_lengths[ip, mth[ip, it] - 1], dmc
+                )
+                out_dmc[ip, it] = dmc
+            if do_ffmc:
+                ffmc = _fine_fuel_moisture_code(tas[ip, it], pr[ip, it], ws[ip, it], rh[ip, it], ffmc)
+                out_ffmc[ip, it] = ffmc
+            if do_isi:
+                isi = _initial_spread_index_kernel(ws[ip, it], ffmc)
+                out_isi[ip, it] = isi
+            if do_bui:
+                bui = _build_up_index_kernel(dmc, dc)
+                out_bui[ip, it] = bui
+            if do_fwi:
+                fwi = _fire_weather_index_kernel(isi, bui)
+                out_fwi[ip, it] = fwi
+            if do_dsr:
+                out_dsr[ip, it] = _daily_severity_rating_kernel(fwi)
+
+        if out_winter_pr.size > 0:
+            out_winter_pr[ip] = wpr
+
+
+def _fire_weather_calc(tas, pr, rh, ws, snd, mth, lat, season_mask, dc0, dmc0, ffmc0, winter_pr, **params):
     """Primary function computing all Fire Weather Indexes. DO NOT CALL DIRECTLY, use `fire_weather_ufunc` instead."""
-    # Dear code reader, sorry.
     outputs = params["outputs"]
-    ind_prevs = {"DC": dc0.copy(), "DMC": dmc0.copy(), "FFMC": ffmc0.copy()}
+    shape = tas.shape
+    ntime = shape[-1]
 
     season_method = params.get("season_method")
-    if season_method is None:
-        # None means "always on"
-        season_mask = np.full_like(tas, True, dtype=bool)
-        # Start with default value
-        ind_prevs["DC"][np.isnan(dc0)] = params["dc_start"]
-        ind_prevs["DMC"][np.isnan(dmc0)] = params["dmc_start"]
-        ind_prevs["FFMC"][np.isnan(ffmc0)] = params["ffmc_start"]
-    elif isinstance(season_method, str) and season_method != "mask":
+    if isinstance(season_method, str) and season_method != "mask":
         # "mask" means it was passed as an arg. Other values are methods so we compute.
         season_mask = _fire_season(
             tas,
@@ -681,193 +1090,92 @@ def _fire_weather_calc(  # noqa: C901  # pylint: disable=R0912, R0915
             snow_condition_days=params["snow_condition_days"],
         )
 
-    # Codes are only computed if they are in "outputs"
-    for ind in list(ind_prevs.keys()):
-        if ind not in outputs:
-            ind_prevs.pop(ind)
-
-    # Outputs as a dict for easier access, but order is important in the return
-    out = OrderedDict()
+    npts = int(np.prod(shape[:-1]))
+    if np.ndim(season_mask) > 0:
+        # A one byte mask, whatever was given.
+        season_mask = np.asarray(season_mask).astype(bool, copy=False)
+
+    # Flatten all non-temporal dimensions into a single "points" axis, the kernels iterate over time for each point.
+    # Inputs that are not needed are None, or 0-d object arrays when they went through dask.
+    def _as_2d(arr, dtype=None):
+        if np.ndim(arr) == 0:
+            return np.empty((0, 0), dtype=dtype or tas.dtype)
+        return _time_contiguous(np.broadcast_to(arr, shape).reshape(npts, ntime))
+
+    # Missing initial states are all NaN. The kernel only reads them, so they can share the same buffer.
+    nans = np.full(npts, np.nan, dtype=tas.dtype)
+
+    def _as_1d(arr):
+        if np.ndim(arr) == 0:
+            return nans
+        return np.broadcast_to(arr, shape[:-1]).reshape(npts)
+
+    # Outputs as a dict for easier access, in the order of the return.
+    # The kernel writes every element of the requested outputs, they don't need to be initialized.
+    out = {}
     for name in outputs:
         if name == "winter_pr":
             # If winter_pr was requested, it should have been given.
-            out[name] = winter_pr.copy()
+            out[name] = np.empty(shape[:-1], dtype=np.asarray(winter_pr).dtype)
         elif name == "season_mask":
             # If the mask was requested as output, put the one given or computed.
             out[name] = season_mask
         else:
-            # Start with NaNs
-            out[name] = np.full_like(tas, np.nan)
-
-    # Cast the mask as integers, use smallest dtype for memory purposes. (maybe this is not impact on performance?)
-    season_mask = season_mask.astype(np.int16)
-
-    overwintering = params["overwintering"]
-    dry_start = params["dry_start"]
-
-    ow_DC = dc0.copy() if dc0 is not None else None
-    ow_DMC = dmc0.copy() if dmc0 is not None else None
-
-    if overwintering and "DC" in ind_prevs:
-        # In overwintering, dc0 is understood as the previous season's last DC code.
-        ow_DC = dc0.copy()
-        ind_prevs["DC"] = np.full_like(dc0, np.nan)
-
-    if dry_start:
-        ow_DC = dc0.copy()
-        ow_DMC = dmc0.copy()
-        start_up_wet = np.zeros_like(dmc0, dtype=bool)  # Pre allocate to avoid "unboundlocalerror"
-
-    # Iterate on all days.
-    for it in range(tas.shape[-1]):
-        if season_method is not None:
-            # Not in the always on mode, thus we must care about start-up and shut-downs of the fire season.
-            if it == 0:
-                if params["initial_start_up"]:
-                    # As if the previous iteration was all 0s
-                    delta = season_mask[..., it]
-                else:
-                    # Continue the previous state
-                    # Meant for special corner cases when we use the season mask
-                    # but some points are already "on" on the first day AND we know previous DC DMC and FFMC.
-                    delta = 0 * season_mask[..., it]
-            else:
-                delta = season_mask[..., it] - season_mask[..., it - 1]
-
-            # In [ME19], there are the 4 cases (in order), no need for the last one, it is implicit.
-            shut_down = delta == -1
-            winter = (delta == 0) & (season_mask[..., it] == 0)
-            start_up = delta == 1
-            # active_season = (delta == 0) & (season_mask[it] == 1)
-
-            if dry_start:
-                # When we use special start values for dry cells,
-                # cells where the current precipitation is significant
-                wetpts = pr[..., it] > params["prec_thresh"]
-
-                if "SNOW" in dry_start and it >= params["snow_cover_days"]:
-                    # This is for the GFWED mode with snow
-                    snow_cover_history = snd[..., it - params["snow_cover_days"] + 1 : it + 1]
-                    snow_days = np.count_nonzero(snow_cover_history > params["snow_thresh"], axis=-1)
-
-                    # Points where the snow cover is enough to trigger a "wet" start-up.
-                    start_up_wet = (
-                        start_up
-                        & (snow_days / params["snow_cover_days"] >= params["snow_min_cover_frac"])
-                        & (snow_cover_history.mean(axis=-1) >= params["snow_min_mean_depth"])
-                    )
-
-            if "DC" in ind_prevs:
-                if overwintering:
-                    # Store end of season DC.
-                    ow_DC[shut_down] = ind_prevs["DC"][shut_down]
-                    # Fist day of winter, put current precip.
-                    out["winter_pr"][shut_down] = pr[shut_down, it]
-                    # Winter, add current precip.
-                    out["winter_pr"][winter] = out["winter_pr"][winter] + pr[winter, it]
-
-                    dc0 = ow_DC[start_up]
-                    # Where ow_DC was NaN (happens at the start of the first season when no ow_DC was given in input),
-                    # put the default start,
-                    ind_prevs["DC"][start_up] = np.where(
-                        np.isnan(dc0),
-                        params["dc_start"],
-                        _overwintering_drought_code(
-                            dc0,
-                            out["winter_pr"][start_up],
-                            params["carry_over_fraction"],
-                            params["wetting_efficiency_fraction"],
-                            params["dc_start"],
-                        ),
-                    )
-                    # Put NaN to be explicit.
-                    ow_DC[start_up] = np.nan
-                    out["winter_pr"][start_up] = np.nan
-                elif dry_start:
-                    # Dry start-up for DC is overridden by overwintering.
-                    ow_DC[shut_down] = params["dc_start"]
-
-                    if "GFWED" in dry_start:
-                        # The GFWED includes the current day in the "wet points" check.
-                        ow_DC[(start_up | winter) & wetpts] = 0
-                        ow_DC[(start_up | winter) & ~wetpts] = (
-                            ow_DC[(start_up | winter) & ~wetpts] + params["dc_dry_factor"]
-                        )
-                    else:  # "CFS"
-                        ow_DC[winter & wetpts] = params["dc_start"]
-                        ow_DC[winter & ~wetpts] = ow_DC[winter & ~wetpts] + params["dc_dry_factor"]
-
-                    if "SNOW" in dry_start:
-                        # Points where we have start-up and where snow cover was enough
-                        # We cancel dry dc accumulation and switch to conventional
-                        ow_DC[start_up_wet] = params["dc_start"]
-                    ind_prevs["DC"][start_up] = ow_DC[start_up]
-                    ow_DC[start_up] = np.nan
-                else:
-                    ind_prevs["DC"][start_up] = params["dc_start"]
-                ind_prevs["DC"][shut_down] = np.nan
-
-            if "DMC" in ind_prevs:
-                if dry_start:
-                    ow_DMC[shut_down] = params["dmc_start"]
-
-                    if "GFWED" in dry_start:
-                        # The GFWED includes the current day in the "wet points" check.
-                        ow_DMC[(start_up | winter) & wetpts] = 0
-                        ow_DMC[(start_up | winter) & ~wetpts] = (
-                            ow_DMC[(start_up | winter) & ~wetpts] + params["dmc_dry_factor"]
-                        )
-                    else:  # "CFS"
-                        ow_DMC[winter & wetpts] = params["dmc_start"]
-                        ow_DMC[winter & ~wetpts] = ow_DMC[winter & ~wetpts] + params["dmc_dry_factor"]
-
-                    if "SNOW" in dry_start:
-                        # Points where we have start-up and where snow cover was enough
-                        # We cancel dry dc accumulation and switch to conventional
-                        ow_DMC[start_up_wet] = params["dmc_start"]
-                    ind_prevs["DMC"][start_up] = ow_DMC[start_up]
-                    ow_DMC[start_up] = np.nan
-                else:
-                    ind_prevs["DMC"][start_up] = params["dmc_start"]
-                ind_prevs["DMC"][shut_down] = np.nan
-
-            if "FFMC" in ind_prevs:
-                ind_prevs["FFMC"][start_up] = params["ffmc_start"]
-                ind_prevs["FFMC"][shut_down] = np.nan
-
-        # Main computation
-        if "DC" in outputs:
-            out["DC"][..., it] = _drought_code(tas[..., it], pr[..., it], mth[..., it], lat, ind_prevs["DC"])
-        if "DMC" in outputs:
-            out["DMC"][..., it] = _duff_moisture_code(
-                tas[..., it],
-                pr[..., it],
-                rh[..., it],
-                mth[..., it],
-                lat,
-                ind_prevs["DMC"],
-            )
-        if "FFMC" in outputs:
-            out["FFMC"][..., it] = _fine_fuel_moisture_code(
-                tas[..., it],
-                pr[..., it],
-                ws[..., it],
-                rh[..., it],
-                ind_prevs["FFMC"],
-            )
-        if "ISI" in outputs:
-            out["ISI"][..., it] = initial_spread_index(ws[..., it], out["FFMC"][..., it])
-        if "BUI" in outputs:
-            out["BUI"][..., it] = build_up_index(out["DMC"][..., it], out["DC"][..., it])
-        if "FWI" in outputs:
-            out["FWI"][..., it] = fire_weather_index(out["ISI"][..., it], out["BUI"][..., it])
+            out[name] = np.empty(shape, dtype=tas.dtype)
 
-        if "DSR" in outputs:
-            out["DSR"][..., it] = daily_severity_rating(out["FWI"][..., it])
+    def _out_2d(name):
+        if name in out:
+            return out[name].reshape(npts, ntime)
+        return np.empty((0, 0), dtype=tas.dtype)
 
-        # Set the previous values
-        for ind, ind_prev in ind_prevs.items():
-            ind_prev[...] = out[ind][..., it]
+    if np.ndim(lat) == 0:
+        # Only needed for DC and DMC
+        day_lengths = day_length_factors = np.empty((0, 12))
+    else:
+        day_lengths, day_length_factors = _build_daylength_tables(_as_1d(lat))
+
+    dry_start = params["dry_start"] or ""
+    _fwi_core(
+        _as_2d(tas),
+        _as_2d(pr),
+        _as_2d(rh),
+        _as_2d(ws),
+        _as_2d(snd),
+        _as_2d(mth, np.int8),
+        day_lengths,
+        day_length_factors,
+        _as_2d(season_mask, np.bool_),
+        _as_1d(dc0),
+        _as_1d(dmc0),
+        _as_1d(ffmc0),
+        _as_1d(winter_pr),
+        _out_2d("DC"),
+        _out_2d("DMC"),
+        _out_2d("FFMC"),
+        _out_2d("ISI"),
+        _out_2d("BUI"),
+        _out_2d("FWI"),
+        _out_2d("DSR"),
+        out["winter_pr"].reshape(-1) if "winter_pr" in out else np.empty(0, dtype=tas.dtype),
+        season_method is not None,
+        params["initial_start_up"],
+        params["overwintering"],
+        bool(dry_start),
+        "GFWED" in dry_start,
+        "SNOW" in dry_start,
+        float(params["dc_start"]),
+        float(params["dmc_start"]),
+        float(params["ffmc_start"]),
+        float(params["carry_over_fraction"]),
+        float(params["wetting_efficiency_fraction"]),
+        float(params["prec_thresh"]),
+        float(params["dc_dry_factor"]),
+        float(params["dmc_dry_factor"]),
+        float(params["snow_thresh"]),
+        int(params["snow_cover_days"]),
+        float(params["snow_min_cover_frac"]),
+        float(params["snow_min_mean_depth"]),
+    )
 
     if len(outputs) == 1:
         return out[outputs[0]]
@@ -1028,8 +1336,13 @@ def fire_weather_ufunc(  # noqa: C901 # numpydoc ignore=PR01,PR02
     skipped and conventional start-up values are used for cells where the snow cover of the last `snow_cover_days` was
     above `snow_thresh` for at least `snow_cover_days` * `snow_min_cover_frac` days and where the mean snow cover over
     the same period was greater of equal to `snow_min_mean_depth`.
+
+    The codes and indexes are returned with the same data type as `tas`. Giving single precision inputs thus halves
+    the memory used by the outputs, while the daily iteration itself is still carried in double precision.
     """
-    indexes = set(indexes or ["DC", "DMC", "FFMC", "ISI", "BUI", "FWI", "DSR"])
+    indexes = set(indexes or _indexes_order)
+    if not indexes.issubset(_indexes_order):
+        raise ValueError(f"Unknown indexes {indexes - set(_indexes_order)}, must be among {list(_indexes_order)}.")
 
     if "DSR" in indexes:
         indexes.update({"FWI"})
@@ -1039,10 +1352,7 @@ def fire_weather_ufunc(  # noqa: C901 # numpydoc ignore=PR01,PR02
         indexes.update({"DC", "DMC"})
     if "ISI" in indexes:
         indexes.update({"FFMC"})
-    indexes = sorted(
-        list(indexes),
-        key=["DC", "DMC", "FFMC", "ISI", "BUI", "FWI", "DSR"].index,
-    )
+    indexes = sorted(indexes, key=_indexes_order.__getitem__)
 
     # Whether each argument is needed in _fire_weather_calc
     # Same order as _fire_weather_calc, Assumes the list of indexes is complete.
@@ -1053,7 +1363,7 @@ def fire_weather_ufunc(  # noqa: C901 # numpydoc ignore=PR01,PR02
         (hurs, "hurs", ["DMC", "FFMC"], True),
         (sfcWind, "sfcWind", ["FFMC"], True),
         (snd, "snd", ["LA08"], True),
-        (tas.time.dt.month, "month", ["DC", "DMC"], True),
+        (tas.time, "month", ["DC", "DMC"], True),
         (lat, "lat", ["DC", "DMC"], False),
     )
     # Arg order : tas, pr, hurs, sfcWind, snd, mth, lat, season_mask, dc0, dmc0, ffmc0, winter_pr
@@ -1072,6 +1382,10 @@ def fire_weather_ufunc(  # noqa: C901 # numpydoc ignore=PR01,PR02
             args[i] = arg
             input_core_dims[i] = ["time"] if has_time_dim else []
 
+    if args[5] is not None:
+        # The month is only computed when needed, as a small integer.
+        args[5] = tas.time.dt.month.astype(np.int8)
+
     # For the GFWED dry start mode, we include snow depth is available
     if snd is not None and dry_start == "GFWED":
         args[4] = snd
@@ -1080,11 +1394,8 @@ def fire_weather_ufunc(  # noqa: C901 # numpydoc ignore=PR01,PR02
     elif dry_start not in [None, "CFS", "GFWED"]:
         raise ValueError("'dry_start' must be one of None, 'CFS' or 'GFWED'.")
 
-    # Always pass the previous codes.
-    _dc0 = xr.full_like(tas.isel(time=0), np.nan) if dc0 is None else dc0
-    _dmc0 = xr.full_like(tas.isel(time=0), np.nan) if dmc0 is None else dmc0
-    _ffmc0 = xr.full_like(tas.isel(time=0), np.nan) if ffmc0 is None else ffmc0
-    args[8:11] = [_dc0, _dmc0, _ffmc0]
+    # Previous codes that are not given (None) default to NaN in _fire_weather_calc.
+    args[8:11] = [dc0, dmc0, ffmc0]
 
     # Output config from the current indexes list
     outputs = indexes
@@ -1245,14 +1556,14 @@ def overwintering_drought_code(
 def _convert_parameters(
     params: dict[str, int | float], funcname: str = "fire weather indices"
 ) -> dict[str, int | float]:
-    for param, value in params.copy().items():
+    for param, value in params.items():
         if param not in default_params:
             raise ValueError(
                 f"{param} is not a valid parameter for {funcname}. "
                 "See the docstring of the function and the list in xc.indices.fire.default_params."
             )
-        if isinstance(default_params[param], tuple):
-            params[param] = convert_units_to(value, default_params[param][1])
+        if param in _params_units:
+            params[param] = convert_units_to(value, _params_units[param])
     return params
 
 
@@ -1648,7 +1959,7 @@ def fire_season(
     ----------
     :cite:cts:`fire-wotton_length_1993,fire-lawson_weather_2008`
     """
-    # TODO: `map_blocks` as currently implemented, does not mix well with non-scalar thresholds passed via kwargs.
+    # TODO: The thresholds are passed as kwargs to the kernel, they can't be arrays.
     if not all(np.isscalar(v) for v in [temp_start_thresh, temp_end_thresh, snow_thresh]):
         raise ValueError("Thresholds must be scalar.")
 
@@ -1661,30 +1972,39 @@ def fire_season(
         "snow_thresh": convert_units_to(snow_thresh, "m"),
     }
 
-    def _apply_fire_season(ds, **kwargs):
-        season_mask = ds.tas.copy(
-            data=_fire_season(
-                tas=ds.tas.values,
-                snd=None if kwargs["method"] == "WF93" else ds.snd.values,
-                **kwargs,
-            )
-        )
-        season_mask.attrs = {}
+    if method not in _fire_season_methods:
+        raise ValueError("`method` must be one of 'WF93', 'LA08' or 'GFWED'.")
 
-        if freq is not None:
+    inputs = [convert_units_to(tas, "degC")]
+    if method != "WF93":
+        if snd is None:
+            raise TypeError(f"`snd` must be given with method '{method}'.")
+        # Align snow depth on the temperature coordinates, the kernel needs both on the same time axis.
+        inputs.extend(xr.align(inputs[0], convert_units_to(snd, "m"), join="left")[1:])
+    if uses_dask(*inputs):
+        # The season depends on all previous days, each block must cover the whole period.
+        inputs = [da.chunk(time=-1) for da in inputs]
+
+    out = xr.apply_ufunc(
+        _fire_season,
+        *inputs,
+        kwargs=kwargs,
+        input_core_dims=[["time"]] * len(inputs),
+        output_core_dims=[["time"]],
+        dask="parallelized",
+        output_dtypes=[bool],
+    )
+
+    if freq is not None:
+
+        def _keep_longest_run(season_mask):
+            # Blocks have a single chunk along time, so the periods are never split.
             time = season_mask.time
             season_mask = season_mask.resample(time=freq).map(rl.keep_longest_run)
             season_mask["time"] = time
+            return season_mask
 
-        return season_mask
-
-    ds = convert_units_to(tas, "degC").rename("tas").to_dataset()
-    if snd is not None:
-        ds["snd"] = convert_units_to(snd, "m")
-        ds = ds.unify_chunks()
-    ds = ds.transpose(..., "time")
+        out = out.map_blocks(_keep_longest_run, template=out)
 
-    tmpl = xr.full_like(ds.tas, np.nan)
-    out = ds.map_blocks(_apply_fire_season, template=tmpl, kwargs=kwargs)
-    out.attrs["units"] = ""
+    out.attrs = {"units": ""}
     return out
@@ -431,8 +431,8 @@ def get_daily_events(
     - ``0`` where operator(da, da_value) is ``False``
     - ``nan`` where da is ``nan``
     """
-    events = compare(da, op, threshold, constrain) * 1
-    events = events.where(~(np.isnan(da)))
+    # Masking the boolean comparison gives floats directly, without an integer copy
+    events = compare(da, op, threshold, constrain).where(da.notnull())
     events = events.rename("events")
     return events
 
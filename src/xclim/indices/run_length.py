@@ -140,7 +140,7 @@ def _smallest_uint(da, dim):
 
 
 # Specifying `one` allows in-place multiplication *=
-@njit
+@njit(cache=True, nogil=True)
 def _cumsum_reset_np(arr, index, one):
     """100110111 -> 100120123"""
     # run the cumsum and prod backwards or forward
@@ -219,6 +219,45 @@ def _cumsum_reset(
     return out
 
 
+@njit(cache=True, nogil=True)
+def _rle_bool_np(arr, first, out):
+    """11011100 -> 2N03NN00 (first) or N20NN300 (last), on 2D arrays (points, time)."""
+    npts, ntime = arr.shape
+    for ip in range(npts):
+        n = 0
+        # Walk backwards for "first", so that the run ends on the element where its length is written.
+        for k in range(ntime):
+            i = ntime - 1 - k if first else k
+            if arr[ip, i]:
+                n += 1
+                run_end = k == ntime - 1 or not arr[ip, i - 1 if first else i + 1]
+                out[ip, i] = n if run_end else np.nan
+            else:
+                n = 0
+                out[ip, i] = 0
+
+
+def _rle_bool(da: xr.DataArray, dim: str, index: str) -> xr.DataArray:
+    """Run length of a boolean array, with all the steps of :py:func:`rle` fused in a single pass."""
+    # Same output dtype as the generic algorithm: the promotion of its unsigned integer cumulative sum with NaN.
+    dtype = np.float32 if np.dtype(_smallest_uint(da, dim)).itemsize <= 2 else np.float64
+
+    def _rle_bool_ufunc(arr):
+        out = np.empty(arr.shape, dtype=dtype)
+        shape2d = (int(np.prod(arr.shape[:-1])), arr.shape[-1])
+        _rle_bool_np(arr.reshape(shape2d), index == "first", out.reshape(shape2d))
+        return out
+
+    return xr.apply_ufunc(
+        _rle_bool_ufunc,
+        da,
+        input_core_dims=[[dim]],
+        output_core_dims=[[dim]],
+        dask="parallelized",
+        output_dtypes=[dtype],
+    )
+
+
 # TODO: Check if rle would be more performant with ffill/bfill instead of two times [{dim: slice(None, None, -1)}]
 def rle(
     da: xr.DataArray,
@@ -251,6 +290,9 @@ def rle(
     xr.DataArray
         The run length array.
     """
+    if da.dtype == bool and not _is_chunked(da, dim):
+        return _rle_bool(da, dim, index)
+
     # "first" case: Algorithm is applied on inverted array and output is inverted back
     if index == "first":
         da = da[{dim: slice(None, None, -1)}]
@@ -1325,7 +1367,10 @@ def first_run_before_date(
     )
 
 
-@njit
+RLE_1D = namedtuple("RLE_1D", ["values", "run_lengths", "start_positions"])
+
+
+@njit(cache=True, nogil=True)
 def _rle_1d(ia) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     y = ia[1:] != ia[:-1]  # pairwise unequal (string safe)
     i = np.append(np.nonzero(y)[0], ia.size - 1)  # must include last element position
@@ -1365,7 +1410,6 @@ def rle_1d(
     """
     ia = np.asarray(arr)
     n = len(ia)
-    RLE_1D = namedtuple("RLE_1D", ["values", "run_lengths", "start_positions"])
 
     if n == 0:
         warn("run length array empty")
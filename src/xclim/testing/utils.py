@@ -15,8 +15,9 @@ import sys
 import time
 import warnings
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib.metadata import PackageNotFoundError
 from io import StringIO
 from pathlib import Path
@@ -167,8 +168,9 @@ def list_input_variables(submodules: Sequence[str] | None = None, realms: Sequen
     from xclim.core.indicator import registry  # pylint: disable=import-outside-toplevel
     from xclim.core.utils import InputKind  # pylint: disable=import-outside-toplevel
 
-    submodules = submodules or [sub for sub in dir(indicators) if not sub.startswith("__")]
-    realms = realms or ["atmos", "ocean", "land", "seaIce"]
+    submodules = set(submodules or [sub for sub in dir(indicators) if not sub.startswith("__")])
+    realms = set(realms or ["atmos", "ocean", "land", "seaIce"])
+    variable_kinds = {InputKind.VARIABLE, InputKind.OPTIONAL_VARIABLE}
 
     variables = defaultdict(list)
     for name, ind in registry.items():
@@ -184,10 +186,7 @@ def list_input_variables(submodules: Sequence[str] | None = None, realms: Sequen
 
         # ok we want this one.
         for varname, meta in ind._all_parameters.items():
-            if meta.kind in [
-                InputKind.VARIABLE,
-                InputKind.OPTIONAL_VARIABLE,
-            ]:
+            if meta.kind in variable_kinds:
                 var = meta.default or varname
                 variables[var].append(ind)
 
@@ -196,6 +195,21 @@ def list_input_variables(submodules: Sequence[str] | None = None, realms: Sequen
 
 # Publishing Tools ###
 
+_hyperlink_replacements = {
+    "rst": [
+        (re.compile(r":issue:`([0-9]+)`"), r"`GH/\1 <https://github.com/Ouranosinc/xclim/issues/\1>`_"),
+        (re.compile(r":pull:`([0-9]+)`"), r"`PR/\1 <https://github.com/Ouranosinc/xclim/pull/\>`_"),
+        (re.compile(r":user:`([a-zA-Z0-9_.-]+)`"), r"`@\1 <https://github.com/\1>`_"),
+    ],
+    "md": [
+        (re.compile(r":issue:`([0-9]+)`"), r"[GH/\1](https://github.com/Ouranosinc/xclim/issues/\1)"),
+        (re.compile(r":pull:`([0-9]+)`"), r"[PR/\1](https://github.com/Ouranosinc/xclim/pull/\1)"),
+        (re.compile(r":user:`([a-zA-Z0-9_.-]+)`"), r"[@\1](https://github.com/\1)"),
+    ],
+}
+_md_titles = [(re.compile(r"\n(.*?)\n([\-]{1,})"), "-"), (re.compile(r"\n(.*?)\n([\^]{1,})"), "^")]
+_md_link_expression = re.compile(r"[\`]{1}([\w\s]+)\s<(.+)>`\_")
+
 
 def publish_release_notes(
     style: str = "md",
@@ -235,39 +249,25 @@ def publish_release_notes(
     with open(changes_file, encoding="utf-8") as hf:
         changes = hf.read()
 
-    if style == "rst":
-        hyperlink_replacements = {
-            r":issue:`([0-9]+)`": r"`GH/\1 <https://github.com/Ouranosinc/xclim/issues/\1>`_",
-            r":pull:`([0-9]+)`": r"`PR/\1 <https://github.com/Ouranosinc/xclim/pull/\>`_",
-            r":user:`([a-zA-Z0-9_.-]+)`": r"`@\1 <https://github.com/\1>`_",
-        }
-    elif style == "md":
-        hyperlink_replacements = {
-            r":issue:`([0-9]+)`": r"[GH/\1](https://github.com/Ouranosinc/xclim/issues/\1)",
-            r":pull:`([0-9]+)`": r"[PR/\1](https://github.com/Ouranosinc/xclim/pull/\1)",
-            r":user:`([a-zA-Z0-9_.-]+)`": r"[@\1](https://github.com/\1)",
-        }
-    else:
+    if style not in _hyperlink_replacements:
         msg = f"Formatting style not supported: {style}"
         raise NotImplementedError(msg)
 
-    for search, replacement in hyperlink_replacements.items():
-        changes = re.sub(search, replacement, changes)
+    for pattern, replacement in _hyperlink_replacements[style]:
+        changes = pattern.sub(replacement, changes)
 
     if style == "md":
         changes = changes.replace("=========\nChangelog\n=========", "# Changelog")
 
-        titles = {r"\n(.*?)\n([\-]{1,})": "-", r"\n(.*?)\n([\^]{1,})": "^"}
-        for title_expression, level in titles.items():
-            found = re.findall(title_expression, changes)
+        for title_expression, level in _md_titles:
+            found = title_expression.findall(changes)
             for grouping in found:
                 fixed_grouping = str(grouping[0]).replace("(", r"\(").replace(")", r"\)")
                 search = rf"({fixed_grouping})\n([\{level}]{'{' + str(len(grouping[1])) + '}'})"
                 replacement = f"{'##' if level == '-' else '###'} {grouping[0]}"
                 changes = re.sub(search, replacement, changes)
 
-        link_expressions = r"[\`]{1}([\w\s]+)\s<(.+)>`\_"
-        found = re.findall(link_expressions, changes)
+        found = _md_link_expression.findall(changes)
         for grouping in found:
             search = rf"`{grouping[0]} <.+>`\_"
             replacement = f"[{str(grouping[0]).strip()}]({grouping[1]})"
@@ -604,6 +604,7 @@ def populate_testing_data(
     repo: str = TESTDATA_REPO_URL,
     branch: str = TESTDATA_BRANCH,
     local_cache: Path = TESTDATA_CACHE_DIR,
+    max_workers: int = 8,
 ) -> None:
     """
     Populate the local cache with the testing data.
@@ -619,15 +620,20 @@ def populate_testing_data(
     local_cache : Path
         The path to the local cache. Defaults to the location set by the platformdirs library.
         The testing data will be downloaded to this local cache.
+    max_workers : int
+        Number of files downloaded concurrently. Default is 8.
     """
     # Create the Pooch instance
     n = nimbus(repo=repo, branch=branch, cache_dir=temp_folder or local_cache)
 
-    # Download the files
+    # Download the files, the downloads are I/O-bound and can be done concurrently
     errored_files = []
-    for file in load_registry():
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(n.fetch, file): file for file in load_registry()}
+    # Results are collected in submission order, so that errors are always reported in the registry order
+    for future, file in futures.items():
         try:
-            n.fetch(file)
+            future.result()
         except HTTPError:
             msg = f"File `{file}` not accessible in remote repository."
             logging.error(msg)
@@ -706,10 +712,13 @@ def gather_testing_data(
 # Testing Utilities ###
 
 
+@lru_cache(maxsize=1024)
 def audit_url(url: str, context: str | None = None) -> str:
     """
     Check if the URL is well-formed.
 
+    Results are cached, as the same URLs are checked each time a testing dataset is opened.
+
     Parameters
     ----------
     url : str
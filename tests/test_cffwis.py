@@ -9,6 +9,7 @@ from xclim.core.options import set_options
 from xclim.core.units import convert_units_to
 from xclim.indices.fire import (
     build_up_index,
+    daily_severity_rating,
     fire_season,
     fire_weather_index,
     fire_weather_ufunc,
@@ -109,6 +110,11 @@ class TestCFFWIS:
             )
         np.testing.assert_allclose(isi, fwi_data.isi.isel(test=0), rtol=1e-6)
 
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_initial_spread_index_dtype(self, dtype):
+        isi = initial_spread_index(np.array([0, 10, 30], dtype=dtype), np.array([60, 85, 95], dtype=dtype))
+        assert isi.dtype == dtype
+
     def test_build_up_index(self, open_dataset):
         fwi_data = open_dataset(self.fwi_test_dataset)
         bui = np.full(fwi_data.time.size, np.nan)
@@ -162,6 +168,16 @@ class TestCFFWIS:
             )
         np.testing.assert_allclose(fwi, fwi_data.fwi.isel(test=0), rtol=1e-6)
 
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_bui_fwi_dsr_dtype(self, dtype):
+        dmc = np.array([0, 15, 60], dtype=dtype)
+        dc = np.array([0, 150, 400], dtype=dtype)
+        bui = build_up_index(dmc, dc)
+        fwi = fire_weather_index(np.array([0.5, 5, 15], dtype=dtype), bui)
+        dsr = daily_severity_rating(fwi)
+        for out in [bui, fwi, dsr]:
+            assert out.dtype == dtype
+
     def test_day_length(self):
         assert _day_length(44, 1) == 6.5
 
@@ -361,6 +377,28 @@ class TestCFFWIS:
 
         assert len(out.keys()) == 7
 
+    def test_fire_weather_ufunc_float32(self, tas_series, pr_series, hurs_series, sfcWind_series):
+        t = np.arange(365)
+        tas = tas_series(15 + 10 * np.sin(2 * np.pi * t / 365), start="2017-01-01")
+        pr = pr_series(np.where(t % 7 == 0, 5.0, 0.0), start="2017-01-01")
+        hurs = hurs_series(np.full(365, 50.0), start="2017-01-01")
+        sfcWind = sfcWind_series(np.full(365, 10.0), start="2017-01-01")
+        lat = xr.full_like(tas.isel(time=0), 45)
+
+        out64 = fire_weather_ufunc(tas=tas, pr=pr, hurs=hurs, sfcWind=sfcWind, lat=lat, season_method="WF93")
+        out32 = fire_weather_ufunc(
+            tas=tas.astype(np.float32),
+            pr=pr.astype(np.float32),
+            hurs=hurs.astype(np.float32),
+            sfcWind=sfcWind.astype(np.float32),
+            lat=lat,
+            season_method="WF93",
+        )
+        for name in ["DC", "DMC", "FFMC", "ISI", "BUI", "FWI", "DSR"]:
+            assert out32[name].dtype == np.float32
+            np.testing.assert_allclose(out32[name], out64[name], rtol=1e-5)
+        np.testing.assert_array_equal(out32["season_mask"], out64["season_mask"])
+
     @pytest.mark.parametrize(
         "key,kwargs",
         [
@@ -390,6 +428,34 @@ class TestCFFWIS:
         bounds = run_bounds(mask, dim="time", coord=True)
         np.testing.assert_array_equal(bounds, expected)
 
+    def test_fire_season_dask(self, tas_series):
+        t = np.arange(3 * 365)
+        tas = tas_series(10 - 15 * np.cos(2 * np.pi * t / 365), start="2017-01-01")
+        tas = convert_units_to(tas, "degC")
+
+        expected = fire_season(tas, freq="YS")
+        out = fire_season(tas.chunk(time=100), freq="YS")
+        assert out.dtype == bool
+        np.testing.assert_array_equal(out, expected)
+
+    def test_fire_season_attrs_and_method(self, tas_series, snd_series):
+        tas = tas_series(np.full(30, 290.0), start="2017-01-01")
+        tas.attrs.update(standard_name="air_temperature", long_name="Mean daily temperature")
+
+        out = fire_season(tas)
+        assert "standard_name" not in out.attrs
+        assert "long_name" not in out.attrs
+        # The dimensionless units set by fire_season are normalized to "1" by `declare_units`.
+        assert out.attrs == {"units": "1"}
+
+        # Snow depth is aligned on the temperature coordinates.
+        snd = snd_series(np.zeros(31), start="2016-12-31")
+        out = fire_season(tas, snd=snd, method="LA08")
+        np.testing.assert_array_equal(out.time, tas.time)
+
+        with pytest.raises(ValueError, match="`method` must be one of"):
+            fire_season(tas, method="LA18")
+
     def test_gfwed_and_indicators(self, open_dataset):
         # Also tests passing parameters as quantity strings
         ds = open_dataset("FWI/GFWED_sample_2017.nc")
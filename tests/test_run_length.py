@@ -130,6 +130,22 @@ def test_rle(ufunc, use_dask, index):
         np.testing.assert_array_equal(out, expected)
 
 
+@pytest.mark.parametrize("use_dask", [True, False])
+@pytest.mark.parametrize("index", ["first", "last"])
+def test_rle_bool(use_dask, index):
+    # Boolean inputs have a fused kernel, it must match the generic algorithm used for other dtypes
+    rng = np.random.default_rng(42)
+    time = pd.date_range("2000-01-01", periods=365, freq="D")
+    da = xr.DataArray(rng.random((365, 3, 4)) < 0.7, coords={"time": time}, dims=("time", "b", "c"))
+    if use_dask:
+        da = da.chunk({"b": 1})
+
+    out = rl.rle(da, index=index)
+    expected = rl.rle(da.astype(np.uint8), index=index)
+    assert out.dtype == expected.dtype
+    xr.testing.assert_equal(out, expected)
+
+
 @pytest.mark.parametrize("use_dask", [True, False])
 @pytest.mark.parametrize("index", ["first", "last"])
 def test_runs_with_holes_identity(use_dask, index):